@@ -10,11 +10,13 @@ def _ensure_dependencies() -> list[str]:
     required = [
         "aiohttp",
         "bs4",
+        "lxml",
         "playwright.async_api",
         "PIL",
         "pytesseract",
         "tqdm",
         "googlesearch",
+        "diskcache",
     ]
     missing = []
     for pkg in required:
@@ -30,25 +32,42 @@ def _ensure_dependencies() -> list[str]:
 import argparse
 import asyncio
 import os
+import random
 import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 try:
     import aiohttp
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, Tag
     from urllib.parse import urljoin
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
     from playwright.async_api import async_playwright
     from PIL import Image
     import pytesseract
-    from tqdm import tqdm
+    from tqdm.asyncio import tqdm_asyncio
     from googlesearch import search
+    import requests
+    import diskcache
 except ImportError:
     aiohttp = None
     BeautifulSoup = None
+    Tag = None
     async_playwright = None
+    PlaywrightTimeoutError = None
     Image = None
     pytesseract = None
-    tqdm = None
+    tqdm_asyncio = None
     search = None
+    requests = None
+    diskcache = None
+try:
+    from tesserocr import PSM, PyTessBaseAPI
+except ImportError:
+    PSM = None
+    PyTessBaseAPI = None
 import re
+import hashlib
+from collections import Counter, OrderedDict
 from io import BytesIO
 from base64 import b64decode
 import curses
@@ -57,53 +76,213 @@ from contextlib import redirect_stdout
 import sys
 
 
-# Helper to run async coroutines in environments with a running event loop
+# Helper to run async coroutines from synchronous code. All coroutines share
+# one event loop on a daemon thread, so it works even when the caller already
+# has a running loop (Streamlit, Jupyter).
+_background_loop = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop():
+    """Return the shared event loop, starting its thread on first use."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, daemon=True).start()
+            _background_loop = loop
+    return _background_loop
+
+
 def _run_async(coro):
-    """Execute ``coro`` even if an event loop is already running."""
-    try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        return asyncio.run(coro)
+    """Execute ``coro`` on the shared event loop and return its result.
 
-    result: dict[str, object] = {}
-    error: dict[str, BaseException] = {}
+    If the caller is interrupted (e.g. Ctrl-C), the coroutine is cancelled
+    and given a moment to run its cleanup before the exception propagates.
+    """
+    finished = threading.Event()
 
-    def _thread_runner() -> None:
+    async def _runner():
         try:
-            result["value"] = asyncio.run(coro)
-        except BaseException as e:
-            error["err"] = e
-            
-    t = threading.Thread(target=_thread_runner)
-    t.start()
-    t.join()
-    if "err" in error:
-        raise error["err"]
-    return result.get("value")
+            return await coro
+        finally:
+            finished.set()
+
+    fut = asyncio.run_coroutine_threadsafe(_runner(), _get_background_loop())
+    try:
+        return fut.result()
+    except BaseException:
+        fut.cancel()
+        # ``fut`` reports cancellation immediately; wait for the task itself.
+        finished.wait(timeout=10)
+        raise
 
 
 # === OCR helpers ===
-def extract_text_from_base64_img(data_url):
+_ocr_executor = None
+_tess_api = None
+
+
+def _init_ocr_worker() -> None:
+    """Open a persistent Tesseract API in each worker process."""
+    global _tess_api
+    if PyTessBaseAPI is not None:
+        try:
+            _tess_api = PyTessBaseAPI(lang="eng", psm=PSM.SINGLE_LINE)
+        except Exception:
+            _tess_api = None
+
+
+def _get_ocr_executor():
+    """Return the shared OCR process pool, creating it on first use."""
+    global _ocr_executor
+    if _ocr_executor is None:
+        # libgomp reads OMP_THREAD_LIMIT when tesserocr is imported, so it
+        # must be in the environment the spawned workers inherit.
+        os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+        # The pool is created from the event-loop thread while other threads
+        # are running, so workers are spawned rather than forked.
+        _ocr_executor = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_ocr_worker,
+        )
+    return _ocr_executor
+
+
+_OCR_HEIGHT = 130
+
+
+def _otsu_threshold(histogram):
+    """Return the Otsu threshold for a 256-bin grayscale histogram."""
+    total = sum(histogram)
+    weighted_total = sum(i * count for i, count in enumerate(histogram))
+    background = 0
+    weighted_background = 0
+    best_threshold = 0
+    best_variance = 0.0
+    for i, count in enumerate(histogram):
+        background += count
+        if background == 0:
+            continue
+        foreground = total - background
+        if foreground == 0:
+            break
+        weighted_background += i * count
+        mean_background = weighted_background / background
+        mean_foreground = (weighted_total - weighted_background) / foreground
+        variance = background * foreground * (mean_background - mean_foreground) ** 2
+        if variance > best_variance:
+            best_variance = variance
+            best_threshold = i
+    return best_threshold
+
+
+def _preprocess_for_ocr(img):
+    """Grayscale, scale to a fixed height and binarize ``img`` for Tesseract."""
+    if img.mode in ("RGBA", "LA", "P"):
+        # Transparent pixels are stored as black; flatten onto white first so
+        # dark glyphs on transparent logos survive the threshold.
+        img = img.convert("RGBA")
+        background = Image.new("RGBA", img.size, (255, 255, 255, 255))
+        img = Image.alpha_composite(background, img)
+    img = img.convert("L")
+    if img.height:
+        width = max(1, int(img.width * _OCR_HEIGHT / img.height))
+        img = img.resize((width, _OCR_HEIGHT))
+    threshold = _otsu_threshold(img.histogram())
+    return img.point(lambda p: 255 if p > threshold else 0)
+
+
+def _ocr_bytes(img_data):
+    """Run Tesseract on raw image bytes.
+
+    Uses the worker's ``tesserocr`` API when available, otherwise falls back
+    to ``pytesseract`` which spawns the ``tesseract`` binary per call.
+    Logos are usually a single line, so Tesseract runs in single-line mode.
+    """
+    img = _preprocess_for_ocr(Image.open(BytesIO(img_data)))
+    if _tess_api is not None:
+        _tess_api.SetImage(img)
+        return _tess_api.GetUTF8Text()
+    return pytesseract.image_to_string(img, config="--psm 7")
+
+
+# Bump when preprocessing or Tesseract settings change so stale entries in
+# ``.ocr_cache`` are not reused.
+_OCR_CACHE_VERSION = "otsu-psm7"
+_OCR_MEMO_SIZE = 1024
+_ocr_memo: OrderedDict[str, str] = OrderedDict()
+_ocr_disk_cache = None
+
+
+def _get_ocr_disk_cache():
+    """Return the on-disk OCR cache, opening it on first use."""
+    global _ocr_disk_cache
+    if _ocr_disk_cache is None:
+        _ocr_disk_cache = diskcache.Cache(".ocr_cache")
+    return _ocr_disk_cache
+
+
+def _remember_ocr(key, text) -> None:
+    _ocr_memo[key] = text
+    _ocr_memo.move_to_end(key)
+    if len(_ocr_memo) > _OCR_MEMO_SIZE:
+        _ocr_memo.popitem(last=False)
+
+
+async def _ocr_bytes_async(img_data):
+    """Run :func:`_ocr_bytes` in the OCR process pool.
+
+    Results are cached by the SHA-256 of the image bytes, in memory (LRU)
+    and on disk, so repeated logos are only recognised once.
+    """
+    key = f"{_OCR_CACHE_VERSION}:{hashlib.sha256(img_data).hexdigest()}"
+    if key in _ocr_memo:
+        _ocr_memo.move_to_end(key)
+        return _ocr_memo[key]
+    disk_cache = _get_ocr_disk_cache()
+    text = disk_cache.get(key)
+    if text is None:
+        loop = asyncio.get_running_loop()
+        text = await loop.run_in_executor(_get_ocr_executor(), _ocr_bytes, img_data)
+        disk_cache.set(key, text)
+    _remember_ocr(key, text)
+    return text
+
+
+async def extract_text_from_base64_img(data_url):
     try:
         if data_url.startswith("data:image"):
             _, encoded = data_url.split(",", 1)
             img_data = b64decode(encoded)
-            img = Image.open(BytesIO(img_data))
-            return pytesseract.image_to_string(img)
-    except:
+            return await _ocr_bytes_async(img_data)
+    except Exception:
         pass
     return ""
 
 
-async def extract_text_from_image_url(img_url, base_url):
+_MAX_IMAGE_BYTES = 5_000_000
+_MIN_IMAGE_BYTES = 256
+
+
+async def extract_text_from_image_url(img_url, base_url, session):
     try:
         full_url = urljoin(base_url, img_url)
-        async with aiohttp.ClientSession() as session:
-            async with session.get(full_url, timeout=10) as r:
-                if r.status == 200:
-                    content = await r.read()
-                    img = Image.open(BytesIO(content))
-                    return pytesseract.image_to_string(img)
+        async with session.get(full_url, timeout=10) as r:
+            if r.status != 200 or not r.content_type.startswith("image/"):
+                return ""
+            if (r.content_length or 0) > _MAX_IMAGE_BYTES:
+                return ""
+            content = bytearray()
+            async for chunk in r.content.iter_chunked(65536):
+                content.extend(chunk)
+                if len(content) > _MAX_IMAGE_BYTES:
+                    return ""
+            # Anything this small is a tracking pixel or spacer, not a logo.
+            if len(content) < _MIN_IMAGE_BYTES:
+                return ""
+            return await _ocr_bytes_async(content)
     except Exception:
         pass
     return ""
@@ -112,8 +291,7 @@ async def extract_text_from_image_url(img_url, base_url):
 def extract_text_from_svg(svg_tag):
     """Extract text from <text> elements in an SVG tag."""
     try:
-        soup = BeautifulSoup(str(svg_tag), "html.parser")
-        text_elements = soup.find_all(["text", "tspan"])
+        text_elements = svg_tag.find_all(["text", "tspan"])
         texts = [t.get_text(" ", strip=True) for t in text_elements]
         return " ".join(texts)
     except Exception:
@@ -121,10 +299,8 @@ def extract_text_from_svg(svg_tag):
 
 
 # === Heuristic to detect valid company names ===
-def is_probable_company_name(name):
-    name = name.strip(" $•-–—·\xb7|→●\t\n\r")
-    name = re.sub(r"(?i)\\blogo+\\b", "", name).strip()
-    banned = [
+_BANNED_NAMES = frozenset(
+    {
         "home",
         "team",
         "contact",
@@ -142,35 +318,150 @@ def is_probable_company_name(name):
         "apply",
         "login",
         "follow",
-    ]
-    if name.lower() in banned:
-        return False
+    }
+)
+_LOGO_RE = re.compile(r"(?i)\blogo+\b")
+_ALPHA_RE = re.compile(r"[A-Za-z]")
+_BAD_CHARS = frozenset("<>{}[]|")
+
+
+def clean_company_name(name):
+    """Return ``name`` without bullets and "logo" words, or ``None`` if it
+    does not look like a company name."""
+    name = name.strip(" $•-–—·\xb7|→●\t\n\r")
+    name = _LOGO_RE.sub("", name).strip()
+    if name.lower() in _BANNED_NAMES:
+        return None
     if len(name) > 60 or len(name) < 2:
-        return False
-    if not re.search(r"[A-Za-z]", name):
-        return False
+        return None
+    if not _ALPHA_RE.search(name):
+        return None
     if len(name.split()) > 5:
-        return False
-    if any(char in name for char in "<>{}[]|"):
-        return False
-    return True
+        return None
+    if not _BAD_CHARS.isdisjoint(name):
+        return None
+    return name
+
+
+def is_probable_company_name(name):
+    return clean_company_name(name) is not None
+
+
+def _harvest_company_names(text, out):
+    """Add every line of ``text`` that looks like a company name to ``out``."""
+    for line in text.splitlines():
+        line = line.strip()
+        if len(line) < 2:
+            continue
+        cleaned = clean_company_name(line)
+        if cleaned:
+            out.add(cleaned)
+
+
+# === Result cache ===
+# Rendered pages and Crunchbase text are kept on disk between runs so that
+# re-analysing the same fund skips Playwright and Google. ``--no-cache``
+# calls ``_set_refresh_result_cache`` to ignore stored entries and overwrite
+# them.
+_RESULT_CACHE_TTL = 86400
+_result_cache = None
+_refresh_result_cache = False
+
+
+def _get_result_cache():
+    """Return the on-disk result cache, opening it on first use."""
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = diskcache.Cache(".vca_cache")
+    return _result_cache
+
+
+def _set_refresh_result_cache(refresh) -> None:
+    """Make cache lookups miss so every result is fetched and stored again."""
+    global _refresh_result_cache
+    _refresh_result_cache = refresh
+
+
+def _cache_get(key):
+    if _refresh_result_cache:
+        return None
+    return _get_result_cache().get(key)
+
+
+def _cache_set(key, value) -> None:
+    _get_result_cache().set(key, value, expire=_RESULT_CACHE_TTL)
 
 
 # === Page rendering ===
-async def fetch_page_content(url):
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        await page.goto(url, timeout=60000)
-        await page.wait_for_timeout(2000)
-        content = await page.content()
-        await browser.close()
-        return content
-
-
-async def find_portfolio_section(base_url):
-    html = await fetch_page_content(base_url)
-    soup = BeautifulSoup(html, "html.parser")
+# Only the rendered HTML is needed; images are downloaded separately for OCR.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def fetch_page_content(url, browser):
+    """Render ``url`` in a fresh context of the shared ``browser``."""
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        await page.route("**/*", _block_heavy_resources)
+        await page.goto(url, timeout=60000, wait_until="domcontentloaded")
+        try:
+            # Let client-side rendering settle, but don't hang on pages that
+            # keep long-lived connections open.
+            await page.wait_for_load_state("networkidle", timeout=10000)
+        except PlaywrightTimeoutError:
+            pass
+        return await page.content()
+    finally:
+        await context.close()
+
+
+class _LazyBrowser:
+    """Start Playwright and Chromium only when a page has to be rendered."""
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._playwright = None
+        self._browser = None
+
+    async def get(self):
+        async with self._lock:
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+            return self._browser
+
+    async def close(self) -> None:
+        try:
+            if self._browser is not None:
+                await self._browser.close()
+        finally:
+            if self._playwright is not None:
+                await self._playwright.stop()
+
+
+async def cached_page_content(url, lazy_browser):
+    """Return the rendered HTML for ``url``, using the result cache.
+
+    The browser is only launched on a cache miss.
+    """
+    key = ("page", url)
+    html = _cache_get(key)
+    if html is None:
+        html = await fetch_page_content(url, await lazy_browser.get())
+        _cache_set(key, html)
+    return html
+
+
+async def find_portfolio_section(base_url, lazy_browser):
+    html = await cached_page_content(base_url, lazy_browser)
+    soup = BeautifulSoup(html, "lxml")
     keywords = ["portfolio", "investments", "companies"]
     candidates = []
     for a in soup.find_all("a", href=True):
@@ -180,9 +471,14 @@ async def find_portfolio_section(base_url):
     return candidates or [base_url]
 
 
-async def parse_portfolio(url):
-    html = await fetch_page_content(url)
-    soup = BeautifulSoup(html, "html.parser")
+_BG_IMAGE_RE = re.compile(r"background-image:\s*url\((.*?)\)")
+# Only absolute sizes count; "10%" or "5em" say nothing about pixel size.
+_DIMENSION_RE = re.compile(r"\s*(\d+)\s*(?:px)?\s*$", re.IGNORECASE)
+
+
+async def parse_portfolio(url, session, lazy_browser):
+    html = await cached_page_content(url, lazy_browser)
+    soup = BeautifulSoup(html, "lxml")
     companies = set()
 
     def extract_near_text(img_tag):
@@ -198,76 +494,193 @@ async def parse_portfolio(url):
                 texts.append(txt)
         return texts
 
-    for img in soup.find_all("img"):
-        src = img.get("src", "")
-        nearby_names = extract_near_text(img)
-        for name in nearby_names:
-            name = name.strip()
-            if is_probable_company_name(name):
-                companies.add(name)
-
-        text = ""
-        if src.startswith("data:image"):
-            text = extract_text_from_base64_img(src)
-        elif src.startswith("/") or src.startswith("http"):
-            text = await extract_text_from_image_url(src, url)
-        for line in text.split("\n"):
-            line = line.strip()
-            if is_probable_company_name(line):
-                companies.add(line)
-
-    for div in soup.find_all("div"):
-        style = div.get("style", "")
-        match = re.search(r"background-image:\s*url\((.*?)\)", style)
-        if match:
-            bg_url = match.group(1).strip("\"'")
-            text = await extract_text_from_image_url(bg_url, url)
-            for line in text.split("\n"):
-                line = line.strip()
-                if is_probable_company_name(line):
-                    companies.add(line)
-
-    for svg in soup.find_all("svg"):
-        text = extract_text_from_svg(svg)
-        for line in text.split("\n"):
-            line = line.strip()
-            if is_probable_company_name(line):
-                companies.add(line)
-
-    for tag in soup.find_all(["p", "li", "div", "span", "a"]):
-        txt = tag.get_text(strip=True)
-        if txt and is_probable_company_name(txt):
-            companies.add(txt)
+    def is_tiny_image(img_tag):
+        for attr in ["width", "height"]:
+            digits = _DIMENSION_RE.match(img_tag.get(attr, ""))
+            if digits and int(digits.group(1)) < 32:
+                return True
+        return False
+
+    # Walk the tree once, collecting image sources so OCR can run as one batch.
+    img_srcs: list[str] = []
+    seen_srcs: set[str] = set()
+
+    def queue_ocr(src):
+        if src not in seen_srcs:
+            seen_srcs.add(src)
+            img_srcs.append(src)
+
+    for tag in soup.descendants:
+        if not isinstance(tag, Tag):
+            continue
+        name = tag.name
+        if name == "img":
+            src = tag.get("src", "")
+            matched = False
+            for near in extract_near_text(tag):
+                cleaned = clean_company_name(near)
+                if cleaned:
+                    companies.add(cleaned)
+                    matched = True
+
+            # OCR is only a fallback for logos without usable text around them.
+            if matched or is_tiny_image(tag):
+                continue
+            if src.startswith("data:image") or src.startswith("/") or src.startswith("http"):
+                queue_ocr(src)
+        elif name == "svg":
+            _harvest_company_names(extract_text_from_svg(tag), companies)
+        elif name in ("p", "li", "div", "span", "a"):
+            if name == "div":
+                match = _BG_IMAGE_RE.search(tag.get("style", ""))
+                if match:
+                    queue_ocr(match.group(1).strip("\"'"))
+            cleaned = clean_company_name(tag.get_text(strip=True))
+            if cleaned:
+                companies.add(cleaned)
+
+    ocr_sem = asyncio.Semaphore(8)
+
+    async def bounded_ocr(src):
+        async with ocr_sem:
+            if src.startswith("data:image"):
+                return await extract_text_from_base64_img(src)
+            return await extract_text_from_image_url(src, url, session)
+
+    texts = await asyncio.gather(*(bounded_ocr(src) for src in img_srcs))
+    for text in texts:
+        _harvest_company_names(text, companies)
 
     print(f"[DEBUG] Найдено компаний: {len(companies)}")
     return sorted(companies)
 
 
-# === Crunchbase via Google Search ===
-async def fetch_crunchbase_html(company_name):
-    try:
-        query = f'site:crunchbase.com "{company_name}"'
-        for url in search(query, num=3):
-            if "crunchbase.com/organization/" in url:
-                headers = {"User-Agent": "Mozilla/5.0"}
-                async with aiohttp.ClientSession(headers=headers) as session:
-                    async with session.get(url, timeout=10) as r:
-                        if r.status == 200:
-                            text = await r.text()
-                            soup = BeautifulSoup(text, "html.parser")
-                            return soup.get_text()
-        await asyncio.sleep(3)  # задержка между поисками
-    except Exception as e:
-        print(f"[ERROR] Crunchbase fetch failed for {company_name}: {e}")
+# === Crunchbase (direct URL, Google Search fallback) ===
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def _crunchbase_slug(company_name):
+    """Return the likely Crunchbase organization slug for ``company_name``."""
+    return _SLUG_RE.sub("-", company_name.lower()).strip("-")
+
+
+async def _get_text_with_backoff(session, url, retries=3):
+    """GET ``url`` and return its body, retrying with jitter on 429/503."""
+    for attempt in range(retries):
+        async with session.get(url, timeout=10) as r:
+            if r.status in (429, 503) and attempt < retries - 1:
+                await asyncio.sleep(2**attempt + random.uniform(0, 1))
+                continue
+            if r.status == 200:
+                return await r.text()
+            return None
+    return None
+
+
+async def _search_with_backoff(query, search_sem, retries=3):
+    """Run a Google search, throttled and retried with jitter on 429/503.
+
+    ``search_sem`` keeps only a few searches in flight; any other error is
+    raised immediately.
+    """
+    async with search_sem:
+        for attempt in range(retries):
+            try:
+                return await asyncio.to_thread(
+                    lambda: list(search(query, num_results=3))
+                )
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status not in (429, 503) or attempt == retries - 1:
+                    raise
+                await asyncio.sleep(3 * 2**attempt + random.uniform(0, 1))
+    return []
+
+
+async def fetch_crunchbase_html(company_name, session, sem, search_sem):
+    key = ("crunchbase", company_name)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    async with sem:
+        try:
+            text = None
+            slug = _crunchbase_slug(company_name)
+            if slug:
+                url = f"https://www.crunchbase.com/organization/{slug}"
+                try:
+                    text = await _get_text_with_backoff(session, url)
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    text = None  # fall back to the search below
+            if not text:
+                query = f'site:crunchbase.com "{company_name}"'
+                urls = await _search_with_backoff(query, search_sem)
+                for url in urls:
+                    if "crunchbase.com/organization/" in url:
+                        text = await _get_text_with_backoff(session, url)
+                        if text:
+                            break
+            if text:
+                soup = BeautifulSoup(text, "lxml")
+                text = soup.get_text()
+                _cache_set(key, text)
+                return text
+        except Exception as e:
+            print(f"[ERROR] Crunchbase fetch failed for {company_name}: {e}")
     return ""
 
 
+# === HTTP session ===
+def _create_session():
+    """Return a ``ClientSession`` with a pooled, DNS-caching connector."""
+    connector = aiohttp.TCPConnector(limit=50, limit_per_host=10, ttl_dns_cache=300)
+    return aiohttp.ClientSession(
+        connector=connector, headers={"User-Agent": "Mozilla/5.0"}
+    )
+
+
+# === Crunchbase text analysis ===
+# One pass over a Crunchbase page picks up years, sectors, countries and
+# dollar amounts ("$5M", "$1.2 million", "20,000 USD"); ``lastgroup`` tells
+# which alternative matched.
+_CRUNCHBASE_RE = re.compile(
+    r"(?P<year>(?<![\d,.])202[345](?!\d|,\d))"
+    r"|(?P<ai>\bai\b)"
+    r"|(?P<saas>\bsaas\b)"
+    r"|(?P<food>food|restaurant|kitchen)"
+    r"|(?P<country>uae|ksa|egypt|jordan|qatar|kuwait)"
+    r"|(?P<amount>\$\s*(?P<value>\d[\d,]*(?:\.\d+)?)\s*(?:(?P<scale>[kmb]|million|billion)\b)?)"
+    r"|(?P<usd_amount>(?P<usd_value>\d[\d,]*(?:\.\d+)?)\s*(?:(?P<usd_scale>[kmb]|million|billion)\s*)?usd\b)",
+    re.IGNORECASE,
+)
+_MENA_COUNTRIES = frozenset({"UAE", "KSA", "EGYPT", "JORDAN", "QATAR", "KUWAIT"})
+_SECTOR_GROUPS = {"ai": "AI", "saas": "SaaS", "food": "FoodTech/F&B"}
+_AMOUNT_SCALES = {"k": 1_000, "m": 1_000_000, "b": 1_000_000_000}
+
+
+def _parse_amount(value, scale):
+    """Return ``value`` (e.g. ``"1,500"`` or ``"2.5"``) scaled by ``scale``."""
+    amount = float(value.replace(",", ""))
+    if scale:
+        amount *= _AMOUNT_SCALES[scale[0].lower()]
+    return amount
+
+
 # === Main Agent Logic ===
 async def analyze_vc_fund(site_url):
-    portfolio_links = await find_portfolio_section(site_url)
+    async with _create_session() as session:
+        lazy_browser = _LazyBrowser()
+        try:
+            await _analyze_vc_fund(site_url, session, lazy_browser)
+        finally:
+            await lazy_browser.close()
+
+
+async def _analyze_vc_fund(site_url, session, lazy_browser):
+    portfolio_links = await find_portfolio_section(site_url, lazy_browser)
     all_companies = set()
     for link in portfolio_links:
-        companies = await parse_portfolio(link)
+        companies = await parse_portfolio(link, session, lazy_browser)
         all_companies.update(companies)
 
     companies = sorted(all_companies)
@@ -283,47 +696,49 @@ async def analyze_vc_fund(site_url):
     amounts = []
 
     print("\n🔍 Анализ компаний на Crunchbase...")
-    for name in tqdm(companies, desc="Обработка компаний"):
-        html = await fetch_crunchbase_html(name)
-        text = html.lower()
-
-        for year in investment_years:
-            if year in text:
-                investment_years[year] += 1
-
-        if "ai" in text:
-            sectors["AI"].append(name)
-        if "saas" in text:
-            sectors["SaaS"].append(name)
-        if any(k in text for k in ["food", "restaurant", "kitchen"]):
-            sectors["FoodTech/F&B"].append(name)
-
-        for country in ["uae", "ksa", "egypt", "jordan", "qatar", "kuwait"]:
-            if country in text:
-                countries.append(country.upper())
-
-        for line in html.splitlines():
-            if "$" in line or "usd" in line:
-                try:
-                    num = "".join(filter(str.isdigit, line))
-                    if num:
-                        amt = int(num)
-                        if 10_000 < amt < 100_000_000:
-                            amounts.append(amt)
-                except:
-                    pass
-        await asyncio.sleep(3)  # задержка между итерациями компаний
+    sem = asyncio.Semaphore(8)
+    # Google rate-limits scrapers far sooner than Crunchbase does.
+    search_sem = asyncio.Semaphore(2)
+    htmls = await tqdm_asyncio.gather(
+        *(fetch_crunchbase_html(name, session, sem, search_sem) for name in companies),
+        desc="Обработка компаний",
+    )
+    for name, html in zip(companies, htmls):
+        years = set()
+        matched_sectors = set()
+        found_countries = {}
+        for m in _CRUNCHBASE_RE.finditer(html):
+            kind = m.lastgroup
+            if kind == "year":
+                years.add(m.group(kind))
+            elif kind in _SECTOR_GROUPS:
+                matched_sectors.add(kind)
+            elif kind == "country":
+                found_countries[m.group(kind).upper()] = None
+            else:
+                if kind == "amount":
+                    amt = _parse_amount(m.group("value"), m.group("scale"))
+                else:
+                    amt = _parse_amount(m.group("usd_value"), m.group("usd_scale"))
+                if 10_000 < amt < 100_000_000:
+                    amounts.append(amt)
+
+        for year in years:
+            investment_years[year] += 1
+        for group, sector in _SECTOR_GROUPS.items():
+            if group in matched_sectors:
+                sectors[sector].append(name)
+        countries.extend(found_countries)
 
     print("\n========= АНАЛИТИКА PO CRUNCHBASE =========")
     print("Инвестиции по годам:", investment_years)
     print("\nИнвестиции в AI:", sectors["AI"])
     print("\nИнвестиции в SaaS:", sectors["SaaS"])
     print("\nИнвестиции в FoodTech/F&B:", sectors["FoodTech/F&B"])
-    top_countries = sorted(set(countries), key=countries.count, reverse=True)[:3]
+    country_counts = Counter(countries)
+    top_countries = [c for c, _ in country_counts.most_common(3)]
     print("\nТоп-3 страны:", top_countries)
-    mena_countries = list(
-        set([c for c in countries if c in ["UAE", "KSA", "EGYPT", "JORDAN", "QATAR", "KUWAIT"]])
-    )
+    mena_countries = [c for c in country_counts if c in _MENA_COUNTRIES]
     print("MENA страны:", mena_countries)
     if amounts:
         print("\nСредний инвестиционный чек:", round(sum(amounts) / len(amounts), 2))
@@ -397,8 +812,16 @@ def main() -> None:
         return
     parser = argparse.ArgumentParser(description="VC Portfolio Analyzer")
     parser.add_argument("--url", help="VC fund website URL")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached pages and Crunchbase results and fetch them again",
+    )
     args = parser.parse_args()
 
+    if args.no_cache:
+        _set_refresh_result_cache(True)
+
     if args.url:
         results = _run_async(_capture_analysis(args.url))
         print(results)
@@ -1,8 +1,6 @@
-import asyncio
 import sys
 import os
 import traceback
-import threading
 
 try:
     import streamlit as st
@@ -22,7 +20,7 @@ if not st.runtime.scriptrunner.is_running_with_streamlit():
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from VCA import _capture_analysis, _ensure_dependencies
+    from VCA import _capture_analysis, _ensure_dependencies, _run_async
 except Exception as e:
     st.error(f"Failed to import application modules: {e}")
     st.info(
@@ -31,30 +29,6 @@ except Exception as e:
     st.stop()
 
 
-def _run_async(coro):
-    """Execute an async coroutine even if a loop is already running."""
-    try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        return asyncio.run(coro)
-
-    result: dict[str, object] = {}
-    error: dict[str, BaseException] = {}
-
-    def _thread_runner() -> None:
-        try:
-            result["value"] = asyncio.run(coro)
-        except BaseException as e:
-            error["err"] = e
-
-    t = threading.Thread(target=_thread_runner)
-    t.start()
-    t.join()
-    if "err" in error:
-        raise error["err"]
-    return result.get("value")
-
-
 def main() -> None:
     """Streamlit application entry point."""
     missing = _ensure_dependencies()